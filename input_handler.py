@@ -0,0 +1,97 @@
+import time
+from collections import deque
+
+import pygame
+
+class InputManager:
+    def __init__(self, latency_samples=120):
+        # Unbounded on purpose: consume() drains it every tick, and dropping a
+        # KEYUP would leave its action stuck in `held`
+        self.events = deque()
+        self.latency_samples = deque(maxlen=latency_samples)
+        self.key_to_action = {}
+        self.held = set()
+        self.pressed = set()
+        self.last_pump = None
+        self.previous_pump = None
+        self.pending_arrived_after = None
+        self.pending_dequeued = None
+
+    def mark_pumped(self):
+        """Call right after pygame.event.get() so event ages can be bounded"""
+        self.previous_pump = self.last_pump
+        self.last_pump = time.perf_counter()
+
+    def set_bindings(self, key_bindings):
+        """Precompute the key code -> actions lookup from the menu's bindings.
+
+        A key bound to several actions maps to all of them, so binding two
+        controls to the same key keeps both working.
+        """
+        self.key_to_action = {}
+        for action, key in key_bindings.items():
+            self.key_to_action[key] = self.key_to_action.get(key, ()) + (action,)
+
+    def reset(self):
+        """Drop buffered events and held keys, e.g. when a new game starts"""
+        self.events.clear()
+        self.held.clear()
+        self.pressed.clear()
+        self.pending_arrived_after = None
+        self.pending_dequeued = None
+
+    def record(self, event):
+        """Buffer a bound KEYDOWN/KEYUP with the window in which it reached the queue.
+
+        The event arrived after the previous pump finished and before the
+        current one did, so those two times bound how long it has been waiting.
+        """
+        if event.type not in (pygame.KEYDOWN, pygame.KEYUP):
+            return
+        actions = self.key_to_action.get(event.key)
+        if actions is None:
+            return
+        dequeued = self.last_pump if self.last_pump is not None else time.perf_counter()
+        arrived_after = self.previous_pump if self.previous_pump is not None else dequeued
+        self.events.append((arrived_after, dequeued, actions, event.type == pygame.KEYDOWN))
+
+    def consume(self):
+        """Apply all buffered events for this tick and return (held, pressed) action sets.
+
+        `pressed` contains every action that went down during the tick, so a
+        tap that is released before the tick runs is still seen by the simulation.
+        """
+        self.pressed.clear()
+        while self.events:
+            arrived_after, dequeued, actions, down = self.events.popleft()
+            if self.pending_dequeued is None:
+                self.pending_arrived_after = arrived_after
+                self.pending_dequeued = dequeued
+            if down:
+                self.held.update(actions)
+                self.pressed.update(actions)
+            else:
+                self.held.difference_update(actions)
+        return self.held, self.pressed
+
+    def mark_presented(self):
+        """Call right after the display flip to record input-to-display latency.
+
+        Each sample is (processing, worst case): time since the pump that
+        dequeued the oldest input, and time since the pump before it, which
+        also covers the wait in the queue while the frame was sleeping.
+        """
+        if self.pending_dequeued is not None:
+            now = time.perf_counter()
+            self.latency_samples.append((now - self.pending_dequeued, now - self.pending_arrived_after))
+            self.pending_arrived_after = None
+            self.pending_dequeued = None
+
+    def get_latency_stats(self):
+        """Return (average processing, average worst case, max worst case) latency in ms, or None"""
+        if not self.latency_samples:
+            return None
+        count = len(self.latency_samples)
+        processing = sum(sample[0] for sample in self.latency_samples) / count
+        worst_case = sum(sample[1] for sample in self.latency_samples) / count
+        return processing * 1000, worst_case * 1000, max(sample[1] for sample in self.latency_samples) * 1000
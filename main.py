@@ -2,6 +2,7 @@ import pygame
 import sys
 from menu import Menu
 from network import NetworkManager
+from input_handler import InputManager
 
 # Initialize Pygame
 pygame.init()
@@ -22,10 +23,12 @@ BLUE = (0, 0, 255)
 screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption("Square Skirmish")
 clock = pygame.time.Clock()
+latency_font = pygame.font.SysFont(None, 24)
 
 # Initialize menu and network
 menu = Menu(WINDOW_WIDTH, WINDOW_HEIGHT)
 network = NetworkManager()
+input_manager = InputManager()
 
 # Game state
 game_state = "menu"  # menu, playing, death
@@ -50,14 +53,16 @@ def reset_game():
         {"x": 500, "y": 200, "width": 200, "height": 20}
     ]
     score = 0
+    input_manager.set_bindings(menu.get_key_bindings())
+    input_manager.reset()
 
-def handle_movement(keys, key_bindings):
-    # Handle player movement
-    if keys[key_bindings["left"]]:
+def handle_movement(held, pressed):
+    # Handle player movement; taps that were released within the tick still count
+    if "move_left" in held or "move_left" in pressed:
         player["x"] -= 5
-    if keys[key_bindings["right"]]:
+    if "move_right" in held or "move_right" in pressed:
         player["x"] += 5
-    if keys[key_bindings["jump"]] and not player["jumping"]:
+    if ("jump" in held or "jump" in pressed) and not player["jumping"]:
         player["vel_y"] = -15
         player["jumping"] = True
 
@@ -101,6 +106,14 @@ def draw_game():
     score_text = font.render(f"Score: {score}", True, WHITE)
     screen.blit(score_text, (10, 10))
     
+    # Draw input-to-display latency
+    latency = input_manager.get_latency_stats()
+    if latency:
+        processing_text = latency_font.render(f"Input->flip (processing): {latency[0]:.1f} ms avg", True, WHITE)
+        screen.blit(processing_text, (10, 45))
+        queue_text = latency_font.render(f"Input->flip (incl. queue wait, upper bound): {latency[1]:.1f} ms avg / {latency[2]:.1f} ms max", True, WHITE)
+        screen.blit(queue_text, (10, 65))
+    
     # Draw other player if in multiplayer
     if network.connected:
         other_player = network.get_other_player()
@@ -120,7 +133,9 @@ def handle_multiplayer():
 
 # Main game loop
 while True:
-    for event in pygame.event.get():
+    events = pygame.event.get()
+    input_manager.mark_pumped()
+    for event in events:
         if event.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
@@ -146,6 +161,7 @@ while True:
         
         # Handle game events
         elif game_state == "playing":
+            input_manager.record(event)
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     game_state = "menu"
@@ -157,8 +173,8 @@ while True:
         menu.update()
         menu.draw(screen)
     elif game_state == "playing":
-        keys = pygame.key.get_pressed()
-        handle_movement(keys, menu.get_key_bindings())
+        held, pressed = input_manager.consume()
+        handle_movement(held, pressed)
         apply_physics()
         handle_multiplayer()
         draw_game()
@@ -166,4 +182,5 @@ while True:
         menu.draw(screen)
     
     pygame.display.flip()
+    input_manager.mark_presented()
     clock.tick(FPS) 
\ No newline at end of file